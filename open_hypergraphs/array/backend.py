@@ -88,6 +88,11 @@ class ArrayBackend(Protocol[A]):
     def full(cls, n, x, dtype) -> A:
         ...
 
+    @classmethod
+    def readonly(cls, x: A) -> A:
+        """ A read-only view of ``x``, so it can be safely shared """
+        ...
+
     ########################################
     # Non-primitive routines (i.e., vector routines built out of primitives)
 
@@ -131,6 +136,48 @@ class ArrayBackend(Protocol[A]):
         result = cls.arange(0, N, x.dtype) - r # O(1)     PRAM
         return result
 
+    # Segmented interleave example run:
+    #   x       = [ 2 0 1 ]
+    #   y       = [ 1 2 1 ]
+    # the interleaving of segments is
+    #   output  = [ x x y | y y | x y ]
+    # compute ptrs
+    #   px      = [ 0 2 2 3 ]
+    #   py      = [ 0 1 3 4 ]
+    # segment i of x is offset by py[i], and segment i of y by px[i+1]
+    #   ix      = [ 0 1 2 ]   + [ 0 0 3 ]   = [ 0 1 5 ]
+    #   iy      = [ 0 1 2 3 ] + [ 2 2 2 3 ] = [ 2 3 4 6 ]
+    #
+    # Complexity
+    #   O(n)     sequential
+    #   O(log n) PRAM CREW (cumsum is log n)
+    @classmethod
+    def segmented_interleave(cls, x: A, y: A) -> A:
+        """Given two equal-length arrays of *sizes* ``x`` and ``y``,
+        output the position of each element of ``concatenate([arange(sum(x)), arange(sum(y))])``
+        in the interleaving of segments ``x₀ y₀ x₁ y₁ ...``
+
+        >>> FiniteFunction._Array.segmented_interleave([2, 0, 1], [1, 2, 1])
+        array([0, 1, 5, 2, 3, 4, 6])
+
+        Params:
+            x: An array of the sizes of each "segment" of the first input
+            y: An array of the sizes of each "segment" of the second input
+
+        Returns:
+            array:
+
+            A permutation of ``arange(sum(x) + sum(y))``
+        """
+        px = cls.zeros(len(x) + 1, dtype=x.dtype)
+        px[1:] = cls.cumsum(x)
+        py = cls.zeros(len(y) + 1, dtype=y.dtype)
+        py[1:] = cls.cumsum(y)
+
+        ix = cls.arange(0, px[-1], x.dtype) + cls.repeat(py[:-1], x)
+        iy = cls.arange(0, py[-1], y.dtype) + cls.repeat(px[1:], y)
+        return cls.concatenate([ix, iy], x.dtype)
+
     @classmethod
     def segmented_sum(cls, s: A, x: A) -> A:
         # O(log n) PRAM CREW, O(n) sequential
@@ -2,8 +2,12 @@
 Almost all exposed functions are thin wrappers around numpy functions.
 The only exceptions are:
 
-* :func:`connected_components` -- wraps `scipy.sparse.csgraph.connected_components`
+* :func:`connected_components` -- a union-find compiled with numba if it's installed, otherwise wraps `scipy.sparse.csgraph.connected_components`
 * :func:`segmented_arange` -- a subroutine implemented in terms of the other primitives
+* :func:`segmented_interleave` -- a single-pass loop compiled with numba, if it's installed
+
+The numba dependency is optional; without it, the generic implementations
+built from numpy primitives are used instead.
 
 This module is the default array backend.
 It's used by :py:class:`FiniteFunction`.
@@ -12,8 +16,85 @@ from typing import List
 import numpy as np
 import scipy.sparse as sparse
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
 from open_hypergraphs.array.backend import ArrayBackend
 
+# NOTE: numba kernels are compiled (and cached) on first call, so importing
+# this module doesn't pay for compilation.
+if numba is not None:
+    @numba.njit(cache=True, boundscheck=False)
+    def _segmented_interleave(x, y):
+        # Same result as ArrayBackend.segmented_interleave, but written as a
+        # single loop over the output, so no temporaries are allocated.
+        nx = 0
+        for i in range(len(x)):
+            nx += x[i]
+        ny = 0
+        for i in range(len(y)):
+            ny += y[i]
+
+        result = np.empty(nx + ny, dtype=x.dtype)
+        ix = 0  # next element of x
+        iy = nx # next element of y
+        k = 0   # position in the interleaving
+        for i in range(len(x)):
+            for _ in range(x[i]):
+                result[ix] = k
+                ix += 1
+                k += 1
+            for _ in range(y[i]):
+                result[iy] = k
+                iy += 1
+                k += 1
+        return result
+
+    @numba.njit(cache=True)
+    def _find(parent, x):
+        # find the root of x, halving the path as we go
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    @numba.njit(cache=True, boundscheck=False)
+    def _connected_components(source, target, n):
+        # Union-find with path halving and union by rank.
+        # NOTE: parent has the same (narrow) dtype as the edge arrays.
+        parent = np.empty(n, dtype=source.dtype)
+        for i in range(n):
+            parent[i] = i
+        rank = np.zeros(n, dtype=np.uint8)
+
+        for i in range(len(source)):
+            a = _find(parent, source[i])
+            b = _find(parent, target[i])
+            if a == b:
+                continue
+            if rank[a] < rank[b]:
+                a, b = b, a
+            parent[b] = a
+            if rank[a] == rank[b]:
+                rank[a] += 1
+
+        # Number components in order of their smallest node; n means unnumbered.
+        component = np.full(n, n, dtype=source.dtype)
+        result = np.empty(n, dtype=source.dtype)
+        c = 0
+        for i in range(n):
+            r = _find(parent, i)
+            if component[r] == n:
+                component[r] = c
+                c += 1
+            result[i] = component[r]
+        return c, result
+else:
+    _segmented_interleave = None
+    _connected_components = None
+
 class NumpyBackend(ArrayBackend):
     Type = np.ndarray
     """ The underlying array type used by functions in the backend. For numpy this is ``np.ndarray``.
@@ -51,9 +132,11 @@ class NumpyBackend(ArrayBackend):
     def any(cls, x: np.ndarray):
         return np.any(x)
 
+    # NOTE: np.cumsum promotes uint32 to uint64; every caller writes the result
+    # back into an array of the input dtype, so keep it narrow to begin with.
     @classmethod
     def cumsum(cls, x):
-        return np.cumsum(x)
+        return np.cumsum(x, dtype=x.dtype)
 
     @classmethod
     def sum(cls, *args, **kwargs):
@@ -67,6 +150,15 @@ class NumpyBackend(ArrayBackend):
     def concatenate(cls, x: List[np.ndarray], dtype):
         return np.concatenate(x, dtype=dtype)
 
+    @classmethod
+    def segmented_interleave(cls, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        # NOTE: the kernel doesn't check bounds, so check lengths here.
+        if len(x) != len(y):
+            raise ValueError(f"x and y must have the same length, but got {len(x)} and {len(y)}")
+        if _segmented_interleave is None:
+            return super().segmented_interleave(x, y)
+        return _segmented_interleave(x, y)
+
     ########################################
     # Utilities
 
@@ -78,6 +170,12 @@ class NumpyBackend(ArrayBackend):
     def argsort(cls, x: np.ndarray) -> np.ndarray:
         return np.argsort(x, kind='stable')
 
+    @classmethod
+    def readonly(cls, x: np.ndarray) -> np.ndarray:
+        x = x.view()
+        x.flags.writeable = False
+        return x
+
     # def bincount(x, *args, **kwargs):
         # return np.bincount(x, *args, **kwargs)
 
@@ -107,6 +205,12 @@ class NumpyBackend(ArrayBackend):
 
         assert len(source) == len(target)
 
+        if _connected_components is not None:
+            # NOTE: the kernel doesn't check bounds, so check edges are in range here.
+            if len(source) > 0 and (max(np.max(source), np.max(target)) >= n or min(np.min(source), np.min(target)) < 0):
+                raise ValueError(f"edges must have endpoints in the range 0 .. {n - 1}")
+            return _connected_components(source, target, n)
+
         # make an n×n sparse matrix representing the graph with edges
         # source[i] → target[i]
         ones = np.ones(len(source), dtype=dtype)
@@ -37,6 +37,7 @@ FiniteFunction(6, [0 1 2 3 4 5 5 5 5 5])
 """
 
 from dataclasses import dataclass
+from functools import cached_property
 from abc import abstractmethod, ABC
 from typing import Protocol, Self, List, Type, Union, Any
 
@@ -56,6 +57,7 @@ class FiniteFunction(ABC):
 
     # the actual data of the FiniteFunction.
     target: Target
+    __slots__ = ('table', 'target')
 
     def __init__(self, target, table):
         self.table = table
@@ -75,6 +77,16 @@ class FiniteFunction(ABC):
             if self.target <= m:
                 raise ValueError(f"table max value must be less than target {self.target} but was {m}")
 
+    @classmethod
+    def _unchecked(cls, target, table) -> Self:
+        """ Construct a FiniteFunction without validating ``table``.
+        Only use this for tables already known to be valid (e.g., a slice of a
+        valid table), since it skips the O(n) checks in ``__init__``. """
+        f = cls.__new__(cls)
+        f.table = table
+        f.target = target
+        return f
+
     def _nonfinite_target(self):
         return ValueError("FiniteFunction must have finite domain, but had target = {self.target}")
 
@@ -214,6 +226,27 @@ class FiniteFunction(ABC):
             raise f._nonfinite_target()
         return type(f)(a + f.target, a + f.table)
 
+    def restrict0(f: 'FiniteFunction', a: int) -> 'FiniteFunction':
+        """
+        Given ``f : a + b → C``, directly compute (ι₀ ; f) instead of by composition.
+
+        >>> f.restrict0(a) == ι₀ >> f
+        """
+        if a < 0 or a > f.source:
+            raise ValueError(f"can't restrict {f.source=} to {a=}")
+        # NOTE: a slice of a valid table is valid, so this is an O(1) view.
+        return type(f)._unchecked(f.target, f.table[:a])
+
+    def restrict1(f: 'FiniteFunction', a: int) -> 'FiniteFunction':
+        """
+        Given ``f : a + b → C``, directly compute (ι₁ ; f) instead of by composition.
+
+        >>> f.restrict1(a) == ι₁ >> f
+        """
+        if a < 0 or a > f.source:
+            raise ValueError(f"can't restrict {f.source=} to {a=}")
+        return type(f)._unchecked(f.target, f.table[a:])
+
     def coproduct(f: 'FiniteFunction', g: 'FiniteFunction') -> 'FiniteFunction':
         """ Given maps ``f : A₀ → B`` and ``g : A₁ → B``
         compute the coproduct ``f.coproduct(g) : A₀ + A₁ → B``"""
@@ -351,6 +384,20 @@ class FiniteFunction(ABC):
         """
         return type(f)(f.source, f.Array.argsort(f.table).astype(f.Dtype))
 
+    def inverse_compose(p: Self, f: 'FiniteFunction') -> 'FiniteFunction':
+        """
+        Given a permutation ``p : A → A`` and a finite function ``f : A → B``,
+        compute ``p⁻¹ ; f`` by writing each ``f(i)`` to position ``p(i)``,
+        without computing the inverse of ``p``.
+
+        >>> p.inverse_compose(f) == p.argsort() >> f
+        """
+        if p.source != p.target or p.target != f.source:
+            raise ValueError(f"Can't compose inverse of {p} with {f}")
+        table = p.Array.zeros(len(f), dtype=f.table.dtype)
+        table[p.table] = f.table
+        return type(f)(f.target, table)
+
     ################################################################################
     # Useful permutations
 
@@ -375,6 +422,22 @@ class FiniteFunction(ABC):
         table[i] = (i % a) * b + i // a
         return cls(b*a, table)
 
+    @classmethod
+    def interleave(cls, a: 'FiniteFunction', b: 'FiniteFunction') -> 'FiniteFunction':
+        """ ``interleave(a, b)`` is the permutation sending each element of
+        ``Σ_{i ∈ N} a(i) + Σ_{i ∈ N} b(i)`` to its position in the interleaving
+        ``(a(0) + b(0)) + (a(1) + b(1)) + ... + (a(N-1) + b(N-1))``.
+
+        It's computed directly from the segment sizes ``a`` and ``b``, but is
+        the inverse of ``(a + b).injections(transpose(2, N))``.
+        """
+        if len(a) != len(b):
+            raise ValueError(f"Can't interleave segments of unequal lengths {len(a)} and {len(b)}")
+        if a.table.dtype != b.table.dtype:
+            raise ValueError(f"a and b must have the same dtype, but got {a.table.dtype} and {b.table.dtype}")
+        table = cls.Array.segmented_interleave(a.table, b.table)
+        return cls(len(table), table)
+
     ################################################################################
     # Sequential-only methods
 
@@ -452,6 +515,8 @@ class FiniteFunction(ABC):
 
 class HasFiniteFunction(Protocol):
     """ Classes which have a chosen finite function implementation """
+    __slots__ = ()
+
     @classmethod
     def FiniteFunction(cls) -> Type[FiniteFunction]:
         ...
@@ -491,6 +556,24 @@ class IndexedCoproduct(HasFiniteFunction):
         """ Return the dtype of the underlying table """
         return self.sources.dtype
 
+    # NOTE: IndexedCoproducts are never mutated after construction, so it's
+    # safe to cache these auxiliary arrays on first use. They're read-only,
+    # since they may be shared (e.g., as the table of a FiniteFunction).
+    @cached_property
+    def _offsets(self):
+        """ Segment pointers: the exclusive prefix sum of ``sources``, so
+        segment ``i`` is ``values[_offsets[i]:_offsets[i+1]]``. """
+        p = self.Array.zeros(len(self.sources) + 1, dtype=self.sources.table.dtype)
+        p[1:] = self.Array.cumsum(self.sources.table)
+        return self.Array.readonly(p)
+
+    @cached_property
+    def _segment_ids(self):
+        """ The index of the segment containing each element of ``values``,
+        i.e., ``repeat(arange(N), sources)``. """
+        dtype = self.sources.table.dtype
+        return self.Array.readonly(self.Array.repeat(self.Array.arange(0, len(self.sources), dtype), self.sources.table))
+
     @classmethod
     def initial(cls, target: Target, dtype=None) -> 'IndexedCoproduct':
         return cls(
@@ -536,10 +619,7 @@ class IndexedCoproduct(HasFiniteFunction):
         True
         """
         N     = len(self.sources)
-
-        # Compute source pointers
-        s_ptr = self.Array.zeros(N+1, dtype=self.sources.table.dtype)
-        s_ptr[1:] = self.Array.cumsum(self.sources.table)
+        s_ptr = self._offsets
 
         for i in range(0, N):
             yield self.FiniteFunction()(self.target, self.values.table[s_ptr[i]:s_ptr[i+1]])
@@ -552,6 +632,32 @@ class IndexedCoproduct(HasFiniteFunction):
     def __add__(x: 'IndexedCoproduct', y: 'IndexedCoproduct') -> 'IndexedCoproduct':
         return x.coproduct(y)
 
+    def interleave(x: 'IndexedCoproduct', y: 'IndexedCoproduct') -> 'IndexedCoproduct':
+        """ Given IndexedCoproducts ``Σ_{i ∈ N} f_i`` and ``Σ_{i ∈ N} g_i``,
+        compute ``Σ_{i ∈ N} (f_i + g_i)``.
+
+        >>> x.interleave(y).values == (x + y).map_indexes(FiniteFunction.transpose(2, len(x))).values
+
+        The values of ``x`` and ``y`` are written directly to their interleaved
+        positions, so ``x + y`` is never materialised.
+        """
+        if len(x) != len(y):
+            raise ValueError(f"Can't interleave IndexedCoproducts of unequal lengths {len(x)} and {len(y)}")
+        if x.target != y.target:
+            raise ValueError(f"x and y must have the same target, but got {x.target} and {y.target}")
+
+        cls = x.FiniteFunction()
+        p = cls.interleave(x.sources, y.sources)
+
+        n = len(x.values)
+        table = x.Array.zeros(len(p), dtype=x.values.table.dtype)
+        table[p.table[:n]] = x.values.table
+        table[p.table[n:]] = y.values.table
+
+        return type(x)(
+            sources = cls(None, x.sources.table + y.sources.table),
+            values  = cls(x.target, table))
+
     def tensor(x: 'IndexedCoproduct', y: 'IndexedCoproduct') -> 'IndexedCoproduct':
         return type(x)(
             sources = x.sources + y.sources,
@@ -619,13 +725,17 @@ class IndexedCoproduct(HasFiniteFunction):
         # TODO: be explicit that s'(a) = Σ_{b ∈ B} s(b) ... ?
         assert len(x.values) == len(y)
 
-        # segmented sum of x.sources
+        # segmented sum of y.sources, with segments given by x.sources.
+        # This is Array.segmented_sum, but using the cached pointers of x and y.
+        sums = y._offsets[x._offsets[1:]] - y._offsets[x._offsets[:-1]]
         return type(x)(
-            sources = x.FiniteFunction()(None, x.FiniteFunction().Array.segmented_sum(x.sources.table, y.sources.table)),
+            sources = x.FiniteFunction()(None, sums),
             values  = y.values)
 
 class HasIndexedCoproduct(HasFiniteFunction):
     """ Classes which have a chosen indexed coproduct implementation """
+    __slots__ = ()
+
     @classmethod
     @abstractmethod
     def IndexedCoproduct(cls) -> Type[IndexedCoproduct]:
@@ -24,25 +24,15 @@ class Optic(FrobeniusFunctor, ABC):
         RA = self.R.map_objects(A)
 
         assert len(FA) == len(RA)
-        n = len(FA)
-        paired = FA + RA
-        p = self.FiniteFunction().transpose(2, n)
-
-        # TODO: Exposing internals of FiniteFunction here isn't nice.
-        sources = self.FiniteFunction()(None, FA.sources.table + RA.sources.table)
-        values = paired.map_indexes(p).values
-        return self.IndexedCoproduct()(sources, values)
+        return FA.interleave(RA)
 
     def map_operations(self, x: FiniteFunction, A: IndexedCoproduct, B: IndexedCoproduct) -> OpenHypergraph:
-        # F(x₀) ● F(x₁) ... F(xn)   :   FA₀ ● FA₁ ... FAn   →   (FB₀ ● M₀) ● (FB₁ ● M₁) ... (FBn ● Mn)
-        fwd = self.F.map_operations(x, A, B)
-
-        # R(x₀) ● R(x₁) ... R(xn)   :   (M₀ ● RB₀) ● (M₁ ● RB₁) ... (Mn ● RBn)   →   RA₀ ● RA₁ ... RAn
-        rev = self.R.map_operations(x, A, B)
-
         cls = self.OpenHypergraph()
+        x0 = x.to_initial()
 
-        # We'll need these types to build identities and interleavings
+        # We'll need these types to build identities and interleavings.
+        # NOTE: each is computed exactly once here and then shared by every
+        # step below, so F and R map the objects of A and B only once per call.
         FA = self.F.map_objects(A.values)
         FB = self.F.map_objects(B.values)
         RA = self.R.map_objects(A.values)
@@ -52,14 +42,17 @@ class Optic(FrobeniusFunctor, ABC):
         # NOTE: we use flatmap here to ensure that each "block" of FB, which
         # might be e.g., F(B₀ ● B₁ ● ... ● Bn) is correctly interleaved:
         # consider that if M = I, then we would need to interleave
-        fwd_interleave = self.interleave_blocks(B.flatmap(FB), M, x.to_initial()).dagger()
-        rev_cointerleave = self.interleave_blocks(M, B.flatmap(RB), x.to_initial())
+        BFB = B.flatmap(FB)
+        BRB = B.flatmap(RB)
 
-        assert fwd.target == fwd_interleave.source
-        assert rev_cointerleave.target == rev.source
+        # F(x₀) ● F(x₁) ... F(xn)   :   FA₀ ● FA₁ ... FAn   →   (FB₀ ● M₀) ● (FB₁ ● M₁) ... (FBn ● Mn)
+        fwd = self.F.map_operations(x, A, B)
 
-        i_FB = self.OpenHypergraph().identity(FB.values, x.to_initial())
-        i_RB = self.OpenHypergraph().identity(RB.values, x.to_initial())
+        # R(x₀) ● R(x₁) ... R(xn)   :   (M₀ ● RB₀) ● (M₁ ● RB₁) ... (Mn ● RBn)   →   RA₀ ● RA₁ ... RAn
+        rev = self.R.map_operations(x, A, B)
+
+        fwd_interleave = self.interleave_blocks(BFB, M, x0).dagger()
+        rev_cointerleave = self.interleave_blocks(M, BRB, x0)
 
         # Make this diagram "c":
         #
@@ -71,17 +64,20 @@ class Optic(FrobeniusFunctor, ABC):
         #                   │ Rf ├──── RA
         # RB ───────────────┤    │
         #                   └────┘
-        lhs = (fwd >> fwd_interleave) @ i_RB
-        rhs = i_FB @ (rev_cointerleave >> rev)
-        c = lhs >> rhs
+        # i.e., (fwd >> fwd_interleave) @ id(RB) >> id(FB) @ (rev_cointerleave >> rev)
+        c = assemble_optic(fwd, fwd_interleave, rev_cointerleave, rev, M)
 
         # now adapt so that the wires labeled RB and RA are 'bent around'.
         d = partial_dagger(c, FA, FB, RA, RB)
 
-        # finally interleave the FA with RA and FB with RB
-        lhs = self.interleave_blocks(FA, RA, x.to_initial()).dagger()
-        rhs = self.interleave_blocks(FB, RB, x.to_initial())
-        return lhs >> d >> rhs
+        # finally interleave the FA with RA and FB with RB.
+        # NOTE: composing d with the spiders interleave_blocks(FA, RA).dagger()
+        # and interleave_blocks(FB, RB) only permutes its boundaries, so we
+        # permute them directly: if p sends each wire of FA●RA to its
+        # interleaved position, the interleaved source of d is p⁻¹ ; d.s
+        pA = cls.FiniteFunction().interleave(FA.sources, RA.sources)
+        pB = cls.FiniteFunction().interleave(FB.sources, RB.sources)
+        return cls(pA.inverse_compose(d.s), pB.inverse_compose(d.t), d.H)
     
 
     def interleave_blocks(self, A: IndexedCoproduct, B: IndexedCoproduct, x: FiniteFunction) -> OpenHypergraph:
@@ -92,12 +88,13 @@ class Optic(FrobeniusFunctor, ABC):
         if len(x) != 0:
             raise ValueError(f"x must be initial, but {x.source=}")
 
-        AB = A + B
+        cls = self.OpenHypergraph()
 
-        s = self.FiniteFunction().identity(len(AB.values))
-        # NOTE: t is the dagger of transpose(2, N) because it appears in the target position!
-        t = AB.sources.injections(self.FiniteFunction().transpose(2, len(A)))
-        return self.OpenHypergraph().spider(s, t, AB.values, x)
+        # NOTE: wires of the spider are labeled in interleaved order, so s sends
+        # each wire of A+B to its interleaved position, and t is the identity.
+        s = cls.FiniteFunction().interleave(A.sources, B.sources)
+        w = s.inverse_compose(A.values + B.values)
+        return cls.half_spider(s, w, x)
 
 
     def adapt(self, c: OpenHypergraph, A: FiniteFunction, B: FiniteFunction):
@@ -113,16 +110,49 @@ class Optic(FrobeniusFunctor, ABC):
         # first, uninterleave to get d : FA●RA → FB●RB
         lhs = self.interleave_blocks(FA, RA, x)
         rhs = self.interleave_blocks(FB, RB, x).dagger()
-        d = lhs >> c >> rhs
+        d = self.OpenHypergraph().compose_list([lhs, c, rhs])
 
         # d is the uninterleaving of source/targets
-        assert d.source == (FA + RA).values
-        assert d.target == (FB + RB).values
+        assert d.source == FA.values + RA.values
+        assert d.target == FB.values + RB.values
 
         # now compute the partial daggering to obtain
         # d : FA●RB → FB●RA
         return partial_dagger(d, FA, FB, RB, RA)
 
+# Build the diagram
+#
+#   ((fwd ; fwd_interleave) ● id(RB)) ; (id(FB) ● (rev_cointerleave ; rev))
+#
+# in one go: the four hypergraphs are concatenated once, and all three internal
+# seams (fwd/fwd_interleave, M, and rev_cointerleave/rev) are quotiented by a
+# single coequalizer.
+def assemble_optic(fwd: OpenHypergraph, fwd_interleave: OpenHypergraph, rev_cointerleave: OpenHypergraph, rev: OpenHypergraph, M: IndexedCoproduct) -> OpenHypergraph:
+    cls = type(fwd)
+    nM = len(M.values)
+    nFB = len(fwd_interleave.t) - nM
+    assert fwd.target == fwd_interleave.source
+    assert rev_cointerleave.target == rev.source
+
+    fs = [fwd, fwd_interleave, rev_cointerleave, rev]
+    H = cls.Hypergraph().coproduct_list([f.H for f in fs])
+    W = H.W
+
+    # index of the first wire of each of fs in H
+    o0, o1, o2, o3 = 0, fwd.H.W, fwd.H.W + fwd_interleave.H.W, W - rev.H.W
+
+    # fwd_interleave has target FB●M, and rev_cointerleave has source M●RB.
+    def wires(tables):
+        return cls.FiniteFunction()(W, cls.FiniteFunction().Array.concatenate(tables, fwd.s.dtype))
+
+    l = wires([fwd.t.table + o0, fwd_interleave.t.table[nFB:] + o1, rev_cointerleave.t.table + o2])
+    r = wires([fwd_interleave.s.table + o1, rev_cointerleave.s.table[:nM] + o2, rev.s.table + o3])
+    q = l.coequalizer(r)
+
+    s = wires([fwd.s.table + o0, rev_cointerleave.s.table[nM:] + o2]) >> q
+    t = wires([fwd_interleave.t.table[:nFB] + o1, rev.t.table + o3]) >> q
+    return cls(s, t, H.coequalize_vertices(q))
+
 # Bend around the A₁ and B₁ wires of a map like c:
 #         ┌─────┐
 # FA  ────┤     ├──── FB
@@ -132,12 +162,13 @@ class Optic(FrobeniusFunctor, ABC):
 #
 # ... to get a map of type FA ● RA → FB ● RB
 def partial_dagger(c: OpenHypergraph, FA: IndexedCoproduct, FB: IndexedCoproduct, RA: IndexedCoproduct, RB: IndexedCoproduct) -> OpenHypergraph:
-    s_i = c.FiniteFunction().inj0(len(FA.values), len(RB.values)) >> c.s
-    s_o = c.FiniteFunction().inj1(len(FB.values), len(RA.values)) >> c.t
-    s = s_i + s_o
-
-    t_i = c.FiniteFunction().inj0(len(FB.values), len(RA.values)) >> c.t
-    t_o = c.FiniteFunction().inj1(len(FA.values), len(RB.values)) >> c.s
-    t = t_i + t_o
+    nFA, nFB, nRA, nRB = len(FA.values), len(FB.values), len(RA.values), len(RB.values)
+    assert len(c.s) == nFA + nRB
+    assert len(c.t) == nFB + nRA
+
+    # NOTE: precomposing with an injection just selects a contiguous range, so
+    # we restrict instead of composing with inj0/inj1.
+    s = c.s.restrict0(nFA) + c.t.restrict1(nFB)
+    t = c.t.restrict0(nFB) + c.s.restrict1(nFA)
 
     return type(c)(s, t, c.H)
@@ -3,7 +3,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from open_hypergraphs.finite_function import FiniteFunction, IndexedCoproduct, HasIndexedCoproduct
 
-@dataclass
+@dataclass(slots=True)
 class Hypergraph(HasIndexedCoproduct):
     s: IndexedCoproduct # sources : Σ_{x ∈ X} arity(e) → W
     t: IndexedCoproduct # targets : Σ_{x ∈ X} coarity(e) → W
@@ -57,6 +57,24 @@ class Hypergraph(HasIndexedCoproduct):
         """ A coproduct of hypergraphs is pointwise on the components """
         assert G.w.target == H.w.target
         assert G.x.target == H.x.target
+
+        # NOTE: when either side is discrete (e.g., an identity or a spider) it
+        # contributes only hypernodes, so we can reuse the hyperedges of the
+        # other side instead of concatenating with empty arrays.
+        IndexedCoproduct = type(G).IndexedCoproduct()
+        if H.is_discrete():
+            return type(G)(
+                s = IndexedCoproduct(G.s.sources, G.s.values.inject0(H.W)),
+                t = IndexedCoproduct(G.t.sources, G.t.values.inject0(H.W)),
+                w = G.w + H.w,
+                x = G.x)
+        if G.is_discrete():
+            return type(G)(
+                s = IndexedCoproduct(H.s.sources, H.s.values.inject1(G.W)),
+                t = IndexedCoproduct(H.t.sources, H.t.values.inject1(G.W)),
+                w = G.w + H.w,
+                x = H.x)
+
         return type(G)(G.s @ H.s, G.t @ H.t, G.w + H.w, G.x + H.x)
 
     @classmethod
@@ -111,6 +129,8 @@ class Hypergraph(HasIndexedCoproduct):
             x = x >> self.x)
 
 class HasHypergraph(HasIndexedCoproduct):
+    __slots__ = ()
+
     @classmethod
     @abstractmethod
     def Hypergraph(cls) -> Type[Hypergraph]:
@@ -32,11 +32,9 @@ def operation_adjacency(f: OpenHypergraph) -> sp.csr_array:
     An operation ``x`` is adjacent to an operation ``y`` if there is a directed
     path from ``x`` to ``y`` going through a single node.
     """
-    Array = FiniteFunction.Array
-
-    x = FiniteFunction.Array.arange(0, len(f.H.x), FiniteFunction.Dtype)
-    x_s = FiniteFunction(len(f.H.x), FiniteFunction.Array.repeat(x, f.H.s.sources.table))
-    x_t = FiniteFunction(len(f.H.x), FiniteFunction.Array.repeat(x, f.H.t.sources.table))
+    # the operation each source/target wire belongs to
+    x_s = FiniteFunction(len(f.H.x), f.H.s._segment_ids)
+    x_t = FiniteFunction(len(f.H.x), f.H.t._segment_ids)
 
     # ● → □
     # edge source is a wire ●, target is an operation □
@@ -11,7 +11,9 @@ import open_hypergraphs.functor.optic as optic
 
 from open_hypergraphs.array.numpy import NumpyBackend
 
+# NOTE: subclasses declare empty __slots__ so instances don't get a __dict__.
 class FiniteFunction(f.FiniteFunction):
+    __slots__ = ()
     Dtype = np.uint32
     Array = NumpyBackend
 
@@ -21,11 +23,15 @@ class IndexedCoproduct(f.IndexedCoproduct):
         return FiniteFunction
 
 class Hypergraph(h.Hypergraph):
+    __slots__ = ()
+
     @classmethod
     def IndexedCoproduct(cls) -> Type[f.IndexedCoproduct]:
         return IndexedCoproduct
 
 class OpenHypergraph(o.OpenHypergraph):
+    __slots__ = ()
+
     @classmethod
     def Hypergraph(cls) -> Type[h.Hypergraph]:
         return Hypergraph
@@ -1,9 +1,10 @@
 from typing import Self, List
 from dataclasses import dataclass
+from functools import lru_cache
 from open_hypergraphs.finite_function import FiniteFunction
 from open_hypergraphs.hypergraph import *
 
-@dataclass
+@dataclass(slots=True)
 class OpenHypergraph(HasHypergraph):
     """ An OpenHypergraph is a cospan in Hypergraph whose feet are discrete. """
     s: FiniteFunction
@@ -27,16 +28,54 @@ class OpenHypergraph(HasHypergraph):
     def signature(self):
         return self.H.w.to_initial(), self.H.x.to_initial()
 
+    # NOTE: identity maps are rebuilt at the same sizes many times, e.g. by
+    # functors, so we cache their tables by size (rather than by the labels w).
+    # Identity tables are always read-only, since they may be shared, but only
+    # small ones are cached so the cache stays small.
+    _IDENTITY_CACHE_MAX_SIZE = 4096
+
+    @classmethod
+    def _identity_table(cls, n: int):
+        return cls.FiniteFunction().Array.readonly(cls.FiniteFunction().identity(n).table)
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _cached_identity_table(cls, n: int):
+        return cls._identity_table(n)
+
+    @classmethod
+    def _identity_map(cls, n: int) -> FiniteFunction:
+        if n > cls._IDENTITY_CACHE_MAX_SIZE:
+            table = cls._identity_table(n)
+        else:
+            table = cls._cached_identity_table(n)
+        return cls.FiniteFunction()._unchecked(n, table)
+
     @classmethod
     def identity(cls, w, x):
         if x.source != 0:
             raise ValueError(f"x.source must be 0, but was {x.source}")
-        s = t = cls.FiniteFunction().identity(w.source)
+        s = t = cls._identity_map(w.source)
         H = cls.Hypergraph().discrete(w, x)
         return cls(s, t, H)
 
+    def is_identity(self) -> bool:
+        """ Check if this OpenHypergraph is an identity map, i.e., its
+        hypergraph is discrete and ``s = t = id``. """
+        if not self.H.is_discrete() or len(self.s) != self.H.W or len(self.t) != self.H.W:
+            return False
+        i = type(self)._identity_map(self.H.W)
+        return bool(self.s == i and self.t == i)
+
     def compose(f: 'OpenHypergraph', g: 'OpenHypergraph'):
         assert f.target == g.source
+        # Composing with an identity is (up to isomorphism) a no-op, so skip the
+        # tensor and coequalizer entirely.
+        if g.is_identity():
+            return f
+        if f.is_identity():
+            return g
+
         h = f @ g
         q = f.t.inject0(g.H.W).coequalizer(g.s.inject1(f.H.W))
         return type(f)(
@@ -47,6 +86,39 @@ class OpenHypergraph(HasHypergraph):
     def __rshift__(f: 'OpenHypergraph', g: 'OpenHypergraph') -> 'OpenHypergraph':
         return f.compose(g)
 
+    @classmethod
+    def compose_list(cls, fs: List['OpenHypergraph']) -> 'OpenHypergraph':
+        """ Compute the n-fold composite ``fs[0] >> fs[1] >> ... >> fs[n-1]`` for n > 0.
+
+        All hypergraphs are concatenated once, and then quotiented by a single
+        coequalizer identifying the wires of every internal boundary, instead
+        of coequalizing each pair in turn.
+        """
+        if len(fs) == 0:
+            raise ValueError("fs must be a nonempty list")
+        for f, g in zip(fs, fs[1:]):
+            assert f.target == g.source
+
+        H = cls.Hypergraph().coproduct_list([f.H for f in fs])
+        W = H.W
+
+        # offsets[i] is the index of the first wire of fs[i] in H
+        offsets = [0]
+        for f in fs:
+            offsets.append(offsets[-1] + f.H.W)
+
+        # identify the target of each fs[i] with the source of fs[i+1]
+        l = cls.FiniteFunction().coproduct_list(
+            [cls.FiniteFunction()(W, f.t.table + k) for f, k in zip(fs[:-1], offsets[:-2])], target=W)
+        r = cls.FiniteFunction().coproduct_list(
+            [cls.FiniteFunction()(W, g.s.table + k) for g, k in zip(fs[1:], offsets[1:-1])], target=W)
+        q = l.coequalizer(r)
+
+        return cls(
+            s = fs[0].s.inject0(W - fs[0].H.W) >> q,
+            t = fs[-1].t.inject1(offsets[-2]) >> q,
+            H = H.coequalize_vertices(q))
+
     ##############################
     # Symmetric monoidal structure
 
@@ -77,7 +149,7 @@ class OpenHypergraph(HasHypergraph):
         if len(x) != 0:
             raise ValueError(f"twist(a, b, x) must have len(x) == 0, but len(x) == {len(x)}")
         s = cls.FiniteFunction().twist(len(a), len(b))
-        t = cls.FiniteFunction().identity(len(a) + len(b))
+        t = cls._identity_map(len(a) + len(b))
         # NOTE: because the twist is in the source map, the type of the wires in
         # this hypergraph is b + a instead of a + b! (this matters!)
         H = cls.Hypergraph().discrete(b + a, x)
@@ -96,7 +168,7 @@ class OpenHypergraph(HasHypergraph):
 
     @classmethod
     def half_spider(cls, s: FiniteFunction, w: FiniteFunction, x: FiniteFunction) -> Self:
-        t = cls.FiniteFunction().identity(len(w))
+        t = cls._identity_map(len(w))
         return cls.spider(s, t, w, x)
 
     @classmethod
@@ -155,8 +227,11 @@ class OpenHypergraph(HasHypergraph):
         if len(x) != len(a) or len(x) != len(b):
             raise ValueError("must have len(x) == len(a) == len(b)")
 
-        s = cls.FiniteFunction().inj0(len(a.values), len(b.values))
-        t = cls.FiniteFunction().inj1(len(a.values), len(b.values))
+        # NOTE: s and t are the injections ι₀ and ι₁ into len(a.values) + len(b.values),
+        # so we take them as views of a single (cached) identity map.
+        i = cls._identity_map(len(a.values) + len(b.values))
+        s = i.restrict0(len(a.values))
+        t = i.restrict1(len(a.values))
         H = cls.Hypergraph()(
             s = cls.IndexedCoproduct()(sources=a.sources, values=s),
             t = cls.IndexedCoproduct()(sources=b.sources, values=t),
@@ -176,6 +251,8 @@ class OpenHypergraph(HasHypergraph):
         return cls(s, t, H)
 
 class HasOpenHypergraph(HasHypergraph):
+    __slots__ = ()
+
     @classmethod
     @abstractmethod
     def OpenHypergraph(cls) -> Type[OpenHypergraph]:
@@ -0,0 +1,18 @@
+import itertools
+import numpy as np
+
+from open_hypergraphs.array.numpy import NumpyBackend
+
+# NOTE: if numba is installed, the numpy backend's kernels are compiled on first
+# call for each type of array they see. We compile them here, before any tests
+# run, so compilation isn't charged to whichever hypothesis example happens to
+# call them first (which would exceed its deadline).
+def pytest_sessionstart(session):
+    # NOTE: mixed read-only and writable arguments are distinct types to numba.
+    for dtype, wx, wy in itertools.product([np.uint32, np.int64], [True, False], [True, False]):
+        x = np.array([1, 0], dtype=dtype)
+        y = np.array([0, 1], dtype=dtype)
+        x.flags.writeable = wx
+        y.flags.writeable = wy
+        NumpyBackend.segmented_interleave(x, y)
+        NumpyBackend.connected_components(x, y, 2, dtype)
@@ -93,6 +93,15 @@ class FiniteFunctionSpec:
     def test_f_cp_inj1_equals_inject1(self, f, a):
         assert f >> FinFun.FiniteFunction.inj1(a, f.target) == f.inject1(a)
 
+    @given(FinFun.indexed_coproducts(n=2))
+    def test_inj_cp_f_equals_restrict(self, c: IndexedCoproduct):
+        f, g = c
+        h = f + g
+        i0 = FinFun.FiniteFunction.inj0(f.source, g.source)
+        i1 = FinFun.FiniteFunction.inj1(f.source, g.source)
+        assert i0 >> h == h.restrict0(f.source)
+        assert i1 >> h == h.restrict1(f.source)
+
     ############################################################################
     # Strict symmetric monoidal properties
 
@@ -240,9 +249,37 @@ class FiniteFunctionSpec:
         # but total segment *sizes* is from y.
         assert len(actual.values) == len(y.values)
 
+    @given(FinFun.indexed_coproducts())
+    def test_indexed_coproduct_cached_arrays_readonly(self, c: IndexedCoproduct):
+        """ Cached arrays may be shared, so they must not be writeable """
+        assert not c._offsets.flags.writeable
+        assert not c._segment_ids.flags.writeable
+
+    @given(FinFun.parallel_indexed_coproducts())
+    def test_indexed_coproduct_interleave(self, xy):
+        x, y = xy
+        p = FinFun.FiniteFunction.transpose(2, len(x))
+        z = x.interleave(y)
+        assert len(z) == len(x)
+        assert z.values == (x + y).map_indexes(p).values
+        assert list(z) == [f + g for f, g in zip(x, y)]
+
     ##########################################################################
     # Useful permutations
 
+    # a permutation p : A → A and an arrow f : A → B
+    @st.composite
+    @staticmethod
+    def permutation_and_arrow(draw):
+        p = draw(FinFun.permutations())
+        f = draw(FinFun.arrows(source=p.target))
+        return p, f
+
+    @given(permutation_and_arrow())
+    def test_inverse_compose(self, pf):
+        p, f = pf
+        assert p.inverse_compose(f) == p.argsort() >> f
+
     @given(st.integers(min_value=0, max_value=64), st.integers(min_value=0, max_value=64))
     def test_transpose_inverse(self, a: int, b: int):
         f = FinFun.FiniteFunction.transpose(a, b)
@@ -250,6 +287,13 @@ class FiniteFunctionSpec:
         id = FinFun.FiniteFunction.identity(b * a)
         assert f >> g == id
 
+    @given(FinFun.parallel_indexed_coproducts())
+    def test_interleave_inverse(self, xy):
+        x, y = xy
+        f = (x + y).sources.injections(FinFun.FiniteFunction.transpose(2, len(x)))
+        g = FinFun.FiniteFunction.interleave(x.sources, y.sources)
+        assert f >> g == FinFun.FiniteFunction.identity(len(f))
+
     # NOTE: the below test passes, but hardcodes an array backend (numpy).
     # @given(st.integers(min_value=0, max_value=64), st.integers(min_value=0, max_value=64))
     # def test_transpose_numpy(self, a: int, b: int):
@@ -71,6 +71,15 @@ class HypergraphSpec:
         assert H.w == G[0].w + G[1].w
         assert H.x == G[0].x + G[1].x
 
+    @given(Hyp.objects(n=1))
+    def test_hypergraph_coproduct_discrete(self, G: List[Hypergraph]):
+        # coproducts with a discrete hypergraph agree with the general case
+        G = G[0]
+        K = type(G).discrete(G.w, G.x.to_initial())
+        for A, B in [(G, K), (K, G)]:
+            expected = type(A)(A.s @ B.s, A.t @ B.t, A.w + B.w, A.x + B.x)
+            assert A + B == expected
+
     @given(Hyp.objects())
     def test_hypergraph_coproduct_list(self, Hs: List[Hypergraph]):
         if len(Hs) == 0:
@@ -45,6 +45,21 @@ class OpenHypergraphSpec:
         # Check the apex of the cospan is discrete with labels A.
         assert f.H.w == f.source
 
+    @given(OpenHyp.identities())
+    def test_is_identity(self, f):
+        assert f.is_identity()
+        # the symmetry on two copies of a nonempty object is not an identity
+        if f.H.W > 0:
+            assert not type(f).twist(f.source, f.source, f.H.x).is_identity()
+
+    @given(OpenHyp.identities())
+    def test_identity_tables_readonly(self, f):
+        """ Identity tables may be shared between callers, so they must not be writeable """
+        g = type(f).identity(f.H.w, f.H.x)
+        large = type(f)._identity_map(type(f)._IDENTITY_CACHE_MAX_SIZE + 1)
+        for table in [g.s.table, g.t.table, large.table]:
+            assert not table.flags.writeable
+
     @given(OpenHyp.arrows())
     def test_identity_law(self, f):
         """ Check that ``f ; id = f`` and ``id ; f == f``. """
@@ -71,6 +86,12 @@ class OpenHypergraphSpec:
         f, g, h = fgh
         _assert_equality_invariants((f >> g) >> h, f >> (g >> h))
 
+    @given(st.integers(min_value=1, max_value=4).flatmap(lambda n: OpenHyp.composite_arrows(n=n)))
+    def test_compose_list(self, fs):
+        actual = OpenHyp.OpenHypergraph.compose_list(fs)
+        expected = reduce(operator.rshift, fs)
+        _assert_equality_invariants(actual, expected)
+
     @given(Hyp.labels().flatmap(lambda labels:
         st.tuples(OpenHyp.composite_arrows(n=2, labels=labels),
                   OpenHyp.composite_arrows(n=2, labels=labels))))
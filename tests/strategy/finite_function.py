@@ -190,6 +190,14 @@ class FiniteFunctionStrategies:
         y = draw(cls.indexed_coproducts(n=len(x.values)))
         return x, y
 
+    @classmethod
+    @st.composite
+    def parallel_indexed_coproducts(draw, cls, n=Random, target=Random):
+        # x, y : Σ_{i ∈ N} ... → T with the same N and T
+        x = draw(cls.indexed_coproducts(n=n, target=target, finite_target=True))
+        y = draw(cls.indexed_coproducts(n=len(x), target=x.target, finite_target=True))
+        return x, y
+
     @classmethod
     @st.composite
     def map_with_indexed_coproducts(draw, cls, n=Random, target=Random):
@@ -4,7 +4,9 @@ from hypothesis import given
 import hypothesis.strategies as st
 
 from open_hypergraphs import *
+from open_hypergraphs.functor.optic import assemble_optic, partial_dagger
 
+from tests.spec.open_hypergraph import _assert_equality_invariants
 from tests.strategy.open_hypergraph import OpenHypergraphStrategies as OpenHyp
 from tests.strategy.finite_function import FiniteFunctionStrategies as FinFun
 
@@ -46,6 +48,40 @@ class DaggerOptic(Optic):
         values = FiniteFunction.initial(A.target, dtype=A.values.dtype)
         return IndexedCoproduct(sources, values)
 
+# Concatenate each block of X with the corresponding block of Y, i.e.,
+# Σ_{i ∈ N} (X_i + Y_i)
+def _concat_blocks(X: IndexedCoproduct, Y: IndexedCoproduct) -> IndexedCoproduct:
+    sources = FiniteFunction(None, X.sources.table + Y.sources.table)
+    return IndexedCoproduct(sources, X.interleave(Y).values)
+
+class FrobeniusDouble(FrobeniusFunctor):
+    """ Maps each object A to A ● A, and each operation x : A → B to
+    x : F(A) → F(B) ● A, so its residual is the (non-empty) type A. """
+    def map_objects(self, objects: FiniteFunction) -> IndexedCoproduct:
+        X = self.IndexedCoproduct().elements(objects)
+        return X.interleave(X)
+
+    def map_operations(self, x: FiniteFunction, a: IndexedCoproduct, b: IndexedCoproduct) -> OpenHypergraph:
+        Fa = a.flatmap(self.map_objects(a.values))
+        Fb = b.flatmap(self.map_objects(b.values))
+        return self.OpenHypergraph().tensor_operations(x, Fa, _concat_blocks(Fb, a))
+
+class FrobeniusResidual(FrobeniusFunctor):
+    """ Identity-on-objects, mapping each operation x : A → B to x : A ● B → A """
+    def map_objects(self, objects: FiniteFunction) -> IndexedCoproduct:
+        return self.IndexedCoproduct().elements(objects)
+
+    def map_operations(self, x: FiniteFunction, a: IndexedCoproduct, b: IndexedCoproduct) -> OpenHypergraph:
+        return self.OpenHypergraph().tensor_operations(x, _concat_blocks(a, b), a)
+
+class ResidualOptic(Optic):
+    # NOTE: F and R have different widths, and residuals are non-empty.
+    F: FrobeniusFunctor = FrobeniusDouble()
+    R: FrobeniusFunctor = FrobeniusResidual()
+
+    def residual(self, x: FiniteFunction, A: IndexedCoproduct, B: IndexedCoproduct) -> IndexedCoproduct:
+        return A
+
 class OpticSpec():
     # A basic test case for the identity on objects A, B
     def test_dagger_optic_identity2(self):
@@ -107,6 +143,59 @@ class OpticSpec():
         assert pA >> Of.source == FA.values + RA.values
         assert pB >> Of.target == FB.values + RB.values
 
+    @given(OpenHyp.arrows(), st.sampled_from([DaggerOptic(), ResidualOptic()]))
+    def test_assemble_optic(self, f, O):
+        cls = self.OpenHypergraph
+        x = f.H.x
+        x0 = x.to_initial()
+        A = f.H.s.map_values(f.H.w)
+        B = f.H.t.map_values(f.H.w)
+
+        FB = O.F.map_objects(B.values)
+        RB = O.R.map_objects(B.values)
+        M  = O.residual(x, A, B)
+
+        fwd = O.F.map_operations(x, A, B)
+        rev = O.R.map_operations(x, A, B)
+        fwd_interleave = O.interleave_blocks(B.flatmap(FB), M, x0).dagger()
+        rev_cointerleave = O.interleave_blocks(M, B.flatmap(RB), x0)
+
+        # (fwd >> fwd_interleave) @ id(RB) >> id(FB) @ (rev_cointerleave >> rev)
+        lhs = (fwd >> fwd_interleave) @ cls.identity(RB.values, x0)
+        rhs = cls.identity(FB.values, x0) @ (rev_cointerleave >> rev)
+
+        c = assemble_optic(fwd, fwd_interleave, rev_cointerleave, rev, M)
+        _assert_equality_invariants(c, lhs >> rhs)
+
+    @given(OpenHyp.arrows(), st.sampled_from([DaggerOptic(), ResidualOptic()]))
+    def test_map_operations_interleaving(self, f, O):
+        cls = self.OpenHypergraph
+        x = f.H.x
+        x0 = x.to_initial()
+        A = f.H.s.map_values(f.H.w)
+        B = f.H.t.map_values(f.H.w)
+
+        FA = O.F.map_objects(A.values)
+        FB = O.F.map_objects(B.values)
+        RA = O.R.map_objects(A.values)
+        RB = O.R.map_objects(B.values)
+        M  = O.residual(x, A, B)
+
+        fwd = O.F.map_operations(x, A, B)
+        rev = O.R.map_operations(x, A, B)
+        fwd_interleave = O.interleave_blocks(B.flatmap(FB), M, x0).dagger()
+        rev_cointerleave = O.interleave_blocks(M, B.flatmap(RB), x0)
+        c = assemble_optic(fwd, fwd_interleave, rev_cointerleave, rev, M)
+        d = partial_dagger(c, FA, FB, RA, RB)
+
+        # map_operations permutes the boundaries of d directly, instead of
+        # composing with the interleaving spiders.
+        expected = cls.compose_list([
+            O.interleave_blocks(FA, RA, x0).dagger(),
+            d,
+            O.interleave_blocks(FB, RB, x0)])
+        _assert_equality_invariants(O.map_operations(x, A, B), expected)
+
 ################################################################################
 # Actual test class
 
@@ -2,6 +2,7 @@
 are correct.  We only test against the numpy backend; other backends should be
 compatible. """
 import unittest
+import pytest
 from hypothesis import given
 import hypothesis.strategies as st
 
@@ -47,6 +48,71 @@ def test_segmented_arange(x):
     assert len(a) == N
     assert np.all(_slow_segmented_arange(x) == a)
 
+# A non-vectorised implementation of segmented_interleave
+def _slow_segmented_interleave(x, y):
+    # the index of each element of x and y, in interleaved order
+    ix = iter(range(0, np.sum(x)))
+    iy = iter(range(np.sum(x), np.sum(x) + np.sum(y)))
+    interleaved = []
+    for a, b in zip(x, y):
+        interleaved.extend(next(ix) for _ in range(a))
+        interleaved.extend(next(iy) for _ in range(b))
+
+    # invert it to find the position of each element
+    r = np.zeros(len(interleaved), dtype=x.dtype)
+    r[interleaved] = np.arange(len(interleaved))
+    return r
+
+@given(
+    xy=st.lists(st.tuples(
+        st.integers(min_value=0, max_value=_MAX_RUN_LENGTH),
+        st.integers(min_value=0, max_value=_MAX_RUN_LENGTH)), min_size=0, max_size=_MAX_RUNS),
+    readonly=st.booleans(),
+)
+def test_segmented_interleave(xy, readonly):
+    x = np.array([a for a, _ in xy], dtype='uint32')
+    y = np.array([b for _, b in xy], dtype='uint32')
+    expected = _slow_segmented_interleave(x, y)
+    x.flags.writeable = y.flags.writeable = not readonly
+
+    # NOTE: the numpy backend may override the generic vectorised routine, so test both.
+    generic = super(NumpyArrayBackend, NumpyArrayBackend).segmented_interleave(x, y)
+    actual = NumpyArrayBackend.segmented_interleave(x, y)
+    assert np.all(generic == expected)
+    assert np.all(actual == expected)
+
+def test_segmented_interleave_unequal_lengths():
+    x = np.array([1, 1, 3], dtype='uint32')
+    y = np.array([1], dtype='uint32')
+    with pytest.raises(ValueError):
+        NumpyArrayBackend.segmented_interleave(x, y)
+
+@given(
+    n=st.integers(min_value=0, max_value=_MAX_RUNS),
+    data=st.data(),
+    readonly=st.booleans(),
+)
+def test_connected_components(n, data, readonly):
+    """ Check components agree with scipy, including the order they're numbered in """
+    import scipy.sparse as sparse
+    edge = st.integers(min_value=0, max_value=n-1) if n > 0 else st.nothing()
+    edges = data.draw(st.lists(st.tuples(edge, edge), max_size=_MAX_RUNS if n > 0 else 0))
+    s = np.array([a for a, _ in edges], dtype='uint32')
+    t = np.array([b for _, b in edges], dtype='uint32')
+    s.flags.writeable = t.flags.writeable = not readonly
+
+    M = sparse.csr_matrix((np.ones(len(s), dtype='uint32'), (s, t)), shape=(n, n))
+    expected_c, expected = sparse.csgraph.connected_components(M)
+    c, actual = NumpyArrayBackend.connected_components(s, t, n, 'uint32')
+    assert c == expected_c
+    assert np.all(actual == expected)
+
+def test_connected_components_out_of_range():
+    s = np.array([0, 5], dtype='uint32')
+    t = np.array([1, 7], dtype='uint32')
+    with pytest.raises(ValueError):
+        NumpyArrayBackend.connected_components(s, t, 3, 'uint32')
+
 
 class NumpyArrayBackendTests(unittest.TestCase, NumpyBackend):
     @classmethod